@@ -4,10 +4,18 @@ Supports multiple signatures on different pages, initials, and protocol.
 """
 
 import io
-from typing import Tuple, List, Dict
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Tuple, List, Dict, Optional
 
 import fitz  # PyMuPDF
+import numpy as np
 import streamlit as st
+import xxhash
 from PIL import Image, ImageDraw
 
 from signer import (
@@ -26,6 +34,8 @@ SIGNATURE_HEIGHT = 50  # Signature height in PDF points
 INITIALS_WIDTH = 50    # Initials width in PDF points
 INITIALS_HEIGHT = 35   # Initials height in PDF points
 MAX_PREVIEW_WIDTH = 600  # Maximum preview width in pixels
+PREVIEW_JPEG_QUALITY = 75  # Placement preview doesn't need lossless output
+SIGNING_TIMEOUT = 120  # Seconds to wait for a signing job before giving up
 
 # Colors to distinguish signatures
 SIGNATURE_COLORS = {
@@ -36,7 +46,11 @@ SIGNATURE_COLORS = {
 # Margins for initials
 INITIALS_MARGIN = 20  # Margin from page edge in PDF points
 
+# Cache keys for PDF bytes use xxh3, much faster than Streamlit's default hashing
+PDF_HASH_FUNCS = {bytes: xxhash.xxh3_64_intdigest}
 
+
+@st.cache_data(max_entries=64, show_spinner=False, hash_funcs=PDF_HASH_FUNCS)
 def pdf_page_to_image(
     pdf_bytes: bytes,
     page_num: int = 0,
@@ -49,30 +63,51 @@ def pdf_page_to_image(
     page_width = page.rect.width
     page_height = page.rect.height
 
-    base_scale = PREVIEW_DPI / PDF_DPI
-    base_width = page_width * base_scale
-
-    if base_width > max_width:
-        scale_factor = max_width / base_width
-    else:
-        scale_factor = 1.0
-
-    final_scale = base_scale * scale_factor
+    # Rasterize directly at the output width, capped at the preview DPI
+    final_scale = min(PREVIEW_DPI / PDF_DPI, max_width / page_width)
 
     mat = fitz.Matrix(final_scale, final_scale)
-    pix = page.get_pixmap(matrix=mat)
-    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+    # Placement preview doesn't need color, render 1 byte per pixel
+    pix = page.get_pixmap(matrix=mat, colorspace=fitz.csGRAY, alpha=False)
+    img = Image.frombuffer("L", (pix.width, pix.height), pix.samples, "raw", "L", pix.stride, 1)
 
     doc.close()
     return img, page_width, page_height, final_scale
 
 
-def get_pdf_page_count(pdf_bytes: bytes) -> int:
-    """Return the number of pages in PDF."""
+@st.cache_data(max_entries=64, show_spinner=False, hash_funcs=PDF_HASH_FUNCS)
+def pdf_summary(pdf_bytes: bytes) -> Dict:
+    """
+    Return page count and page sizes of PDF in a single pass.
+
+    Returns:
+        Dict with "count" and "sizes", a list of (width, height) in PDF points
+    """
     doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-    count = len(doc)
+    sizes = [(page.rect.width, page.rect.height) for page in doc]
     doc.close()
-    return count
+    return {"count": len(sizes), "sizes": sizes}
+
+
+def get_preview_canvas(img: Image.Image, canvas_key: Tuple) -> Image.Image:
+    """
+    Return the persistent RGB canvas for a preview page, with the region of
+    the previously drawn boxes restored from the base image.
+
+    The canvas lives in session state and is reused across reruns, so only
+    the box area is rewritten instead of copying the whole page each time.
+    """
+    state = st.session_state.get("preview_canvas")
+    if state is None or state["key"] != canvas_key:
+        # Preview is grayscale, the colored boxes need an RGB canvas
+        state = {"key": canvas_key, "canvas": img.convert("RGB"), "dirty": None}
+        st.session_state.preview_canvas = state
+    elif state["dirty"]:
+        dirty = state["dirty"]
+        state["canvas"].paste(img.crop(dirty), dirty[:2])
+        state["dirty"] = None
+
+    return state["canvas"]
 
 
 def draw_signature_boxes(
@@ -82,17 +117,25 @@ def draw_signature_boxes(
     page_width_pts: float,
     page_height_pts: float,
     selected_idx: int = -1,
+    canvas_key: Optional[Tuple] = None,
 ) -> Image.Image:
-    """Draw signature rectangles on page image."""
-    img_copy = img.copy()
-    draw = ImageDraw.Draw(img_copy, 'RGBA')
-
+    """
+    Draw signature rectangles on page image.
+
+    With canvas_key the boxes are drawn onto the persistent canvas for that
+    key (see get_preview_canvas), otherwise onto a copy of img.
+    """
+    # Points -> pixels ratios are the same for every box on the page
+    sx = img.width / page_width_pts
+    sy = img.height / page_height_pts
+
+    # Collect the boxes for this page column-wise, the overlay is sized to their union
+    indices, types, xs, ys, widths, heights = [], [], [], [], [], []
     for i, sig in enumerate(signatures):
         if sig["page"] != page_num:
             continue
 
         sig_type = sig.get("type", "full")
-        color = SIGNATURE_COLORS.get(sig_type, SIGNATURE_COLORS["full"])
 
         # Size based on type
         if sig_type == "initials":
@@ -102,34 +145,76 @@ def draw_signature_boxes(
             sig_width = SIGNATURE_WIDTH
             sig_height = SIGNATURE_HEIGHT
 
-        sig_width_px = int(sig_width * (img.width / page_width_pts))
-        sig_height_px = int(sig_height * (img.height / page_height_pts))
+        indices.append(i)
+        types.append(sig_type)
+        xs.append(int(sig["x"] * sx))
+        ys.append(int((page_height_pts - sig["y"] - sig_height) * sy))
+        widths.append(int(sig_width * sx))
+        heights.append(int(sig_height * sy))
+
+    # Nothing to draw, the cached preview is never mutated so return it as is
+    if not indices:
+        return img
+
+    canvas = get_preview_canvas(img, canvas_key) if canvas_key is not None else None
+
+    # Draw on a transparent layer covering only the union of the boxes
+    left = min(xs)
+    top = min(ys)
+    right = max(x + w for x, w in zip(xs, widths))
+    bottom = max(y + h for y, h in zip(ys, heights))
 
-        x_pts = sig["x"]
-        y_pts = sig["y"]
+    overlay = Image.new("RGBA", (right - left + 1, bottom - top + 1), (0, 0, 0, 0))
 
-        pixel_x = int(x_pts * (img.width / page_width_pts))
-        pixel_y = int((page_height_pts - y_pts - sig_height) * (img.height / page_height_pts))
+    for i, sig_type, pixel_x, pixel_y, sig_width_px, sig_height_px in zip(
+        indices, types, xs, ys, widths, heights
+    ):
+        color = SIGNATURE_COLORS.get(sig_type, SIGNATURE_COLORS["full"])
 
         is_selected = (i == selected_idx)
         border_width = 4 if is_selected else 2
 
-        fill_color = (*color, 60)
-        draw.rectangle(
-            [pixel_x, pixel_y, pixel_x + sig_width_px, pixel_y + sig_height_px],
-            fill=fill_color,
-        )
-        draw.rectangle(
-            [pixel_x, pixel_y, pixel_x + sig_width_px, pixel_y + sig_height_px],
-            outline=color,
-            width=border_width,
-        )
+        # Fill and borders are plain slice writes into the box's own RGBA patch
+        box = np.empty((sig_height_px + 1, sig_width_px + 1, 4), dtype=np.uint8)
+        box[:] = (*color, 60)
+        box[:border_width] = (*color, 255)
+        box[-border_width:] = (*color, 255)
+        box[:, :border_width] = (*color, 255)
+        box[:, -border_width:] = (*color, 255)
+
+        # Composite rather than overwrite, so overlapping boxes blend and keep their borders
+        overlay.alpha_composite(Image.fromarray(box), dest=(pixel_x - left, pixel_y - top))
 
-        # Label
+    # Labels are few, they still go through ImageDraw
+    draw = ImageDraw.Draw(overlay)
+    for i, sig_type, pixel_x, pixel_y in zip(indices, types, xs, ys):
+        color = SIGNATURE_COLORS.get(sig_type, SIGNATURE_COLORS["full"])
         label = f"#{i + 1}" if sig_type == "full" else "I"
-        draw.text((pixel_x + 5, pixel_y + 5), label, fill=color)
+        draw.text((pixel_x - left + 5, pixel_y - top + 5), label, fill=color)
+
+    if canvas is None:
+        # Preview is grayscale, the colored boxes need an RGB canvas
+        canvas = img.convert("RGB")
+    else:
+        # Remember what to restore before the next draw
+        st.session_state.preview_canvas["dirty"] = (
+            left, top, left + overlay.width, top + overlay.height,
+        )
+
+    canvas.paste(overlay, (left, top), overlay)
+    return canvas
+
+
+def image_to_jpeg(img: Image.Image) -> bytes:
+    """
+    Encode preview image for st.image.
 
-    return img_copy
+    Passing encoded bytes skips Streamlit's own encoding of PIL images,
+    which uses maximum JPEG quality and produces a much larger payload.
+    """
+    output = io.BytesIO()
+    img.save(output, format="JPEG", quality=PREVIEW_JPEG_QUALITY)
+    return output.getvalue()
 
 
 def get_initials_position(
@@ -152,6 +237,84 @@ def get_initials_position(
     return x, y
 
 
+def clear_pending_positions() -> None:
+    """Drop staged slider positions, e.g. after signatures were removed."""
+    pending_keys = [
+        key for key in st.session_state
+        if key.startswith(("sig_x_pending_", "sig_y_pending_"))
+    ]
+    for key in pending_keys:
+        del st.session_state[key]
+
+
+@st.cache_resource
+def get_signing_executor() -> ProcessPoolExecutor:
+    """
+    Return the process pool shared by all sessions for signing jobs.
+
+    Signing is CPU-bound (PDF rewrite + cryptography), running it in worker
+    processes keeps it off the GIL so concurrent sessions don't serialize.
+
+    Workers are spawned, not forked: forking the multithreaded server could
+    hand a child a lock held by another session thread and hang it.
+    """
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def reset_signing_executor(executor: ProcessPoolExecutor) -> None:
+    """
+    Tear down a hung or broken signing pool and let the next job start a fresh one.
+
+    Future.cancel() can't stop a job that is already running, so a timed out
+    job would keep its worker busy for every session. The workers are
+    terminated instead; jobs of other sessions on this pool fail with
+    BrokenProcessPool.
+    """
+    # Another session may have replaced the pool already, don't drop the new one
+    if get_signing_executor() is executor:
+        get_signing_executor.clear()
+
+    # shutdown() forgets the worker processes, grab them first
+    workers = list((executor._processes or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for worker in workers:
+        worker.terminate()
+
+
+def get_session_temp_dir() -> str:
+    """
+    Return this session's temp directory for signed PDFs.
+
+    The TemporaryDirectory lives in session state, so its finalizer removes
+    the directory once Streamlit drops a closed session, and at the latest
+    when the server exits.
+    """
+    if "signed_pdf_dir" not in st.session_state:
+        st.session_state.signed_pdf_dir = tempfile.TemporaryDirectory(prefix="esignature-")
+    return st.session_state.signed_pdf_dir.name
+
+
+def store_signed_pdf(signed_pdf_bytes: bytes) -> None:
+    """Write the signed PDF to a temp file and keep only its path in session state."""
+    discard_signed_pdf()
+    with tempfile.NamedTemporaryFile(
+        suffix=".pdf", dir=get_session_temp_dir(), delete=False
+    ) as tmp:
+        tmp.write(signed_pdf_bytes)
+    st.session_state.signed_pdf_path = tmp.name
+
+
+def discard_signed_pdf() -> None:
+    """Delete the signed PDF temp file, if any."""
+    path = st.session_state.signed_pdf_path
+    if path:
+        Path(path).unlink(missing_ok=True)
+    st.session_state.signed_pdf_path = None
+
+
 def main():
     st.set_page_config(
         page_title="Keboola eSignature",
@@ -162,8 +325,10 @@ def main():
     # Initialize session state
     if "signatures" not in st.session_state:
         st.session_state.signatures = []
-    if "signed_pdf" not in st.session_state:
-        st.session_state.signed_pdf = None
+    if "signed_pdf_path" not in st.session_state:
+        st.session_state.signed_pdf_path = None
+    if "signed_pdf_source" not in st.session_state:
+        st.session_state.signed_pdf_source = None
     if "signer_name" not in st.session_state:
         st.session_state.signer_name = None
     if "selected_signature" not in st.session_state:
@@ -178,6 +343,8 @@ def main():
         st.session_state.initials_offset_y = 0
     if "current_page" not in st.session_state:
         st.session_state.current_page = 0
+    if "initials_preview_page" not in st.session_state:
+        st.session_state.initials_preview_page = 0
     if "active_tab" not in st.session_state:
         st.session_state.active_tab = "signatures"
 
@@ -208,10 +375,20 @@ def main():
             help="Enter the password to unlock your certificate"
         )
 
+        # getvalue() copies the upload buffer, so read each file only once per rerun
+        pdf_bytes = pdf_file.getvalue() if pdf_file else None
+        p12_bytes = p12_file.getvalue() if p12_file else None
+
+        # A signed PDF from a previous upload is stale, drop its temp file
+        pdf_file_id = pdf_file.file_id if pdf_file else None
+        if pdf_file_id != st.session_state.signed_pdf_source:
+            discard_signed_pdf()
+            st.session_state.signed_pdf_source = pdf_file_id
+
         # Certificate info
         if p12_file and password:
             try:
-                signer_name = get_signer_name(p12_file.getvalue(), password)
+                signer_name = get_signer_name(p12_bytes, password)
                 st.session_state.signer_name = signer_name
                 initials = get_initials(signer_name)
                 st.success(f"Certificate: **{signer_name}**")
@@ -263,7 +440,6 @@ def main():
             if st.button("Sign PDF", type="primary", use_container_width=True, disabled=not can_sign):
                 try:
                     with st.spinner("Signing document..."):
-                        pdf_bytes = pdf_file.getvalue()
                         all_signatures = []
 
                         # Add regular signatures
@@ -276,11 +452,9 @@ def main():
                             })
 
                         # Add initials
+                        page_sizes = pdf_summary(pdf_bytes)["sizes"]
                         for page in st.session_state.initials_pages:
-                            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-                            p = doc[page]
-                            pw, ph = p.rect.width, p.rect.height
-                            doc.close()
+                            pw, ph = page_sizes[page]
 
                             init_x, init_y = get_initials_position(
                                 st.session_state.initials_corner,
@@ -296,33 +470,55 @@ def main():
                                 "type": "initials",
                             })
 
-                        # Sign
-                        signed_pdf_bytes = sign_pdf_multiple(
-                            pdf_bytes=pdf_file.getvalue(),
-                            p12_bytes=p12_file.getvalue(),
+                        # Sign in a worker process, errors are re-raised by result()
+                        executor = get_signing_executor()
+                        future = executor.submit(
+                            sign_pdf_multiple,
+                            pdf_bytes=pdf_bytes,
+                            p12_bytes=p12_bytes,
                             p12_password=password,
                             signatures=all_signatures,
                             lock_after_signing=lock_pdf,
                             add_protocol_page=add_protocol,
                         )
+                        signed_pdf_bytes = future.result(timeout=SIGNING_TIMEOUT)
 
-                        st.session_state.signed_pdf = signed_pdf_bytes
+                        store_signed_pdf(signed_pdf_bytes)
                         st.success("PDF signed successfully!")
 
                 except CertificateValidationError as e:
                     st.error(f"Certificate validation failed: {str(e)}")
-                    st.session_state.signed_pdf = None
+                    discard_signed_pdf()
+                except FutureTimeoutError:
+                    # The job keeps running in its worker, kill the pool to free it
+                    reset_signing_executor(executor)
+                    st.error("Signing timed out. Please try again.")
+                    discard_signed_pdf()
+                except BrokenProcessPool:
+                    # A dead worker breaks the shared pool for every session, start a fresh one
+                    reset_signing_executor(executor)
+                    st.error("Signing failed. Please check your certificate and PDF file.")
+                    discard_signed_pdf()
                 except Exception as e:
                     st.error("Signing failed. Please check your certificate and PDF file.")
-                    st.session_state.signed_pdf = None
+                    discard_signed_pdf()
 
-            if st.session_state.signed_pdf:
+            signed_pdf_data = None
+            if st.session_state.signed_pdf_path:
+                try:
+                    signed_pdf_data = Path(st.session_state.signed_pdf_path).read_bytes()
+                except FileNotFoundError:
+                    # Temp file was cleaned up underneath us, the user has to sign again
+                    discard_signed_pdf()
+                    st.warning("The signed PDF is no longer available. Please sign again.")
+
+            if signed_pdf_data is not None:
                 original_name = pdf_file.name
                 signed_name = original_name.replace(".pdf", "_signed.pdf")
 
                 st.download_button(
                     label="Download Signed PDF",
-                    data=st.session_state.signed_pdf,
+                    data=signed_pdf_data,
                     file_name=signed_name,
                     mime="application/pdf",
                     use_container_width=True,
@@ -338,14 +534,21 @@ def main():
         st.info("Upload a PDF document and certificate in the sidebar to get started.")
         return
 
-    pdf_bytes = pdf_file.getvalue()
-    page_count = get_pdf_page_count(pdf_bytes)
-
-    # Tabs for signature types
-    tab_signature, tab_initials = st.tabs(["Signatures", "Initials"])
+    page_count = pdf_summary(pdf_bytes)["count"]
+
+    # Tab selector for signature types. st.tabs runs every tab body on each
+    # rerun, a radio lets only the visible tab render its preview.
+    active_tab = st.radio(
+        "View",
+        options=["signatures", "initials"],
+        format_func=lambda x: "Signatures" if x == "signatures" else "Initials",
+        horizontal=True,
+        label_visibility="collapsed",
+        key="active_tab",
+    )
 
     # ============== SIGNATURES TAB ==============
-    with tab_signature:
+    if active_tab == "signatures":
         st.markdown("**Digital Signature** - full signature with date")
 
         # Page selector and buttons
@@ -355,9 +558,11 @@ def main():
             page_num_sig = st.selectbox(
                 "Page",
                 options=range(page_count),
+                index=min(st.session_state.current_page, page_count - 1),
                 format_func=lambda x: f"Page {x + 1} of {page_count}",
                 key="page_selector_sig"
             )
+            st.session_state.current_page = page_num_sig
 
         with col_add:
             if st.button("+ Add Signature", type="primary", key="add_sig"):
@@ -377,6 +582,7 @@ def main():
                     s for s in st.session_state.signatures if s.get("type") == "initials"
                 ]
                 st.session_state.selected_signature = -1
+                clear_pending_positions()
                 st.rerun()
 
         # Preview and controls for signatures
@@ -416,8 +622,9 @@ def main():
                     page_width_pts,
                     page_height_pts,
                     st.session_state.selected_signature,
+                    canvas_key=(pdf_file_id, page_num_sig),
                 )
-                st.image(img_with_boxes, caption=f"Page {page_num_sig + 1}")
+                st.image(image_to_jpeg(img_with_boxes), caption=f"Page {page_num_sig + 1}")
 
                 # Legend
                 st.markdown("""
@@ -436,32 +643,35 @@ def main():
                             f"Signature #{global_idx + 1}",
                             expanded=(global_idx == st.session_state.selected_signature)
                         ):
-                            new_x = st.slider(
-                                "Position X",
-                                min_value=0,
-                                max_value=int(page_width_pts - SIGNATURE_WIDTH),
-                                value=int(sig["x"]),
-                                key=f"sig_x_{global_idx}",
-                            )
-
-                            new_y = st.slider(
-                                "Position Y",
-                                min_value=0,
-                                max_value=int(page_height_pts - SIGNATURE_HEIGHT),
-                                value=int(sig["y"]),
-                                key=f"sig_y_{global_idx}",
-                            )
-
-                            if new_x != sig["x"] or new_y != sig["y"]:
-                                st.session_state.signatures[global_idx]["x"] = new_x
-                                st.session_state.signatures[global_idx]["y"] = new_y
-                                st.session_state.selected_signature = global_idx
-                                st.rerun()
-
-                            if st.button("Remove", key=f"del_{global_idx}"):
-                                st.session_state.signatures.pop(global_idx)
-                                st.session_state.selected_signature = -1
-                                st.rerun()
+                            with st.form(f"sig_form_{global_idx}", border=False):
+                                # The form batches slider moves, nothing reruns until a submit
+                                new_x = st.slider(
+                                    "Position X",
+                                    min_value=0,
+                                    max_value=int(page_width_pts - SIGNATURE_WIDTH),
+                                    value=int(sig["x"]),
+                                    key=f"sig_x_pending_{global_idx}",
+                                )
+
+                                new_y = st.slider(
+                                    "Position Y",
+                                    min_value=0,
+                                    max_value=int(page_height_pts - SIGNATURE_HEIGHT),
+                                    value=int(sig["y"]),
+                                    key=f"sig_y_pending_{global_idx}",
+                                )
+
+                                if st.form_submit_button("Apply Position"):
+                                    st.session_state.signatures[global_idx]["x"] = new_x
+                                    st.session_state.signatures[global_idx]["y"] = new_y
+                                    st.session_state.selected_signature = global_idx
+                                    st.rerun()
+
+                                if st.form_submit_button("Remove"):
+                                    st.session_state.signatures.pop(global_idx)
+                                    st.session_state.selected_signature = -1
+                                    clear_pending_positions()
+                                    st.rerun()
                 else:
                     st.info("No signatures on this page. Click '+ Add Signature' to add one.")
 
@@ -474,7 +684,7 @@ def main():
             st.error(f"Error loading PDF: {str(e)}")
 
     # ============== INITIALS TAB ==============
-    with tab_initials:
+    if active_tab == "initials":
         st.markdown("**Initials** - 'seen by' confirmation mark")
 
         # Position settings
@@ -484,6 +694,8 @@ def main():
             corner = st.radio(
                 "Corner position",
                 options=["left", "right"],
+                # Restore the stored corner, the widget is not rendered while the tab is hidden
+                index=["left", "right"].index(st.session_state.initials_corner),
                 format_func=lambda x: "Bottom left" if x == "left" else "Bottom right",
                 horizontal=True,
                 key="initials_corner_select"
@@ -541,9 +753,11 @@ def main():
         page_num_init = st.selectbox(
             "Preview page",
             options=range(page_count),
+            index=min(st.session_state.initials_preview_page, page_count - 1),
             format_func=lambda x: f"Page {x + 1} of {page_count}",
             key="page_selector_init"
         )
+        st.session_state.initials_preview_page = page_num_init
 
         try:
             img, page_width_pts, page_height_pts, scale = pdf_page_to_image(pdf_bytes, page_num_init)
@@ -574,12 +788,13 @@ def main():
                 page_width_pts,
                 page_height_pts,
                 -1,  # No selection in initials tab
+                canvas_key=(pdf_file_id, page_num_init),
             )
 
             col_preview_init, col_info_init = st.columns([3, 2])
 
             with col_preview_init:
-                st.image(img_with_boxes, caption=f"Page {page_num_init + 1}")
+                st.image(image_to_jpeg(img_with_boxes), caption=f"Page {page_num_init + 1}")
 
             with col_info_init:
                 if page_num_init in st.session_state.initials_pages:
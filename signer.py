@@ -1,12 +1,17 @@
 """PDF signing functionality using pyhanko with visual signatures."""
 
+import functools
+import hashlib
 import io
 import logging
 import re
+import secrets
+import threading
+import time
 import unicodedata
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import BinaryIO, Optional, List, Dict, Set, Tuple
 
 import fitz  # PyMuPDF
 from pyhanko.pdf_utils.incremental_writer import IncrementalPdfFileWriter
@@ -21,12 +26,37 @@ from pyhanko.stamp import TextStampStyle
 # Path to signature font (Dancing Script for fancy name)
 FONT_PATH = Path(__file__).parent / "fonts" / "DancingScript-Regular.ttf"
 
+# Font file contents, read once so rendering doesn't hit the filesystem per signature
+_FONT_BYTES = FONT_PATH.read_bytes() if FONT_PATH.exists() else None
+
 # Signature appearance constants
 SIGNATURE_WIDTH = 150
 SIGNATURE_HEIGHT = 50
 INITIALS_WIDTH = 50
 INITIALS_HEIGHT = 35
 
+# Default (width, height) per signature type, unknown types use "full"
+_DEFAULT_SIG_SIZE = {
+    "initials": (INITIALS_WIDTH, INITIALS_HEIGHT),
+    "full": (SIGNATURE_WIDTH, SIGNATURE_HEIGHT),
+}
+
+# Colors (PyMuPDF RGB, 0-1) used by the signature appearance and protocol page
+_BLACK = (0, 0, 0)
+_WHITE = (1, 1, 1)
+_DATE_GRAY = (0.3, 0.3, 0.3)
+_FOOTER_GRAY = (0.4, 0.4, 0.4)
+_URL_GRAY = (0.5, 0.5, 0.5)
+
+# Local timezone name shown next to the signing time, resolved once at import
+_TZ_NAME = time.tzname[1] if time.daylight else time.tzname[0]
+
+# Loaded signers hold decrypted private keys, keep only a few and not for long
+_SIGNER_CACHE_SIZE = 2
+_SIGNER_CACHE_TTL = 300  # seconds
+_signer_cache: Dict[bytes, Tuple[float, signers.SimpleSigner]] = {}
+_signer_cache_lock = threading.Lock()
+
 
 def load_signer_from_p12(
     p12_bytes: bytes,
@@ -44,12 +74,47 @@ def load_signer_from_p12(
         raise ValueError(f"Failed to load P12 certificate: {str(e)}") from e
 
 
-def get_signer_name_from_signer(signer: signers.SimpleSigner) -> str:
-    """Extract the common name (CN) from the signer's certificate."""
+def _load_signer_cached(
+    p12_bytes: bytes,
+    p12_password: str,
+) -> signers.SimpleSigner:
+    """
+    Load a signer like load_signer_from_p12, reusing recent results.
+
+    PKCS12 decryption is the expensive part of loading and the same
+    certificate is loaded on every UI rerun. Entries are keyed by a digest,
+    so neither the certificate nor the password is retained, and expire
+    after _SIGNER_CACHE_TTL seconds. Failed loads raise and are not cached.
+    """
+    digest = hashlib.sha256()
+    digest.update(len(p12_bytes).to_bytes(8, "big"))
+    digest.update(p12_bytes)
+    digest.update(p12_password.encode("utf-8"))
+    key = digest.digest()
+
+    now = time.monotonic()
+    with _signer_cache_lock:
+        for cached_key, (loaded_at, _) in list(_signer_cache.items()):
+            if now - loaded_at > _SIGNER_CACHE_TTL:
+                del _signer_cache[cached_key]
+        entry = _signer_cache.get(key)
+        if entry is not None:
+            return entry[1]
+
+    signer = load_signer_from_p12(p12_bytes, p12_password)
+
+    with _signer_cache_lock:
+        _signer_cache[key] = (now, signer)
+        while len(_signer_cache) > _SIGNER_CACHE_SIZE:
+            # Dicts keep insertion order, drop the oldest entry first
+            del _signer_cache[next(iter(_signer_cache))]
+    return signer
+
+
+def _common_name(subject: Dict) -> str:
+    """Return the CN from a decoded certificate subject, or "Unknown"."""
     try:
-        cert = signer.signing_cert
-        subject = cert.subject
-        cn = subject.native.get('common_name', None)
+        cn = subject.get('common_name', None)
         if cn:
             return cn
         return "Unknown"
@@ -57,12 +122,45 @@ def get_signer_name_from_signer(signer: signers.SimpleSigner) -> str:
         return "Unknown"
 
 
-def get_certificate_info(signer: signers.SimpleSigner) -> Dict:
+def get_signer_name_from_signer(signer: signers.SimpleSigner) -> str:
+    """Extract the common name (CN) from the signer's certificate."""
+    try:
+        return _common_name(signer.signing_cert.subject.native)
+    except Exception:
+        return "Unknown"
+
+
+def get_signer_name_and_info(signer: signers.SimpleSigner) -> Tuple[str, Dict]:
+    """
+    Extract the common name (CN) and the certificate details together.
+
+    Decoding the subject (asn1crypto ``.native``) walks the whole RDN
+    sequence, this decodes it once for both results.
+
+    Returns:
+        Tuple of raw (unsanitized) CN and the dict from get_certificate_info
+    """
+    try:
+        subject = signer.signing_cert.subject.native
+    except Exception:
+        return "Unknown", get_certificate_info(signer)
+
+    return _common_name(subject), get_certificate_info(signer, subject=subject)
+
+
+def get_certificate_info(
+    signer: signers.SimpleSigner,
+    subject: Optional[Dict] = None,
+) -> Dict:
     """
     Extract detailed information from the signer's certificate.
 
     All string values are sanitized to prevent injection attacks.
 
+    Args:
+        signer: Signer whose certificate is described
+        subject: Already decoded ``cert.subject.native``, decoded here if omitted
+
     Returns:
         Dict with certificate details
     """
@@ -84,7 +182,8 @@ def get_certificate_info(signer: signers.SimpleSigner) -> Dict:
         cert = signer.signing_cert
 
         # Subject info - sanitize all string values
-        subject = cert.subject.native
+        if subject is None:
+            subject = cert.subject.native
         cn = sanitize_cert_field(subject.get('common_name', 'Unknown'))
         org = sanitize_cert_field(subject.get('organization_name', ''))
         country = sanitize_cert_field(subject.get('country_name', ''), max_length=50)
@@ -130,13 +229,22 @@ def get_certificate_info(signer: signers.SimpleSigner) -> Dict:
 def get_signer_name(p12_bytes: bytes, p12_password: str) -> str:
     """Extract and sanitize the common name (CN) from a P12 certificate."""
     try:
-        signer = load_signer_from_p12(p12_bytes, p12_password)
+        signer = _load_signer_cached(p12_bytes, p12_password)
         raw_name = get_signer_name_from_signer(signer)
         return sanitize_signer_name(raw_name)
     except Exception:
         return "Unknown"
 
 
+# Academic titles stripped by get_initials. Dotted titles need their dot and
+# "mba" a word boundary, so names like "Inga" or "Docekal" are left intact.
+_TITLE_RE = re.compile(
+    r'\b(?:(?:ing|mgr|bc|mudr|judr|phdr|rndr|doc|prof|ph\.d|csc|drsc|dis)\.|mba\b)',
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=128)
 def get_initials(name: str) -> str:
     """
     Generate initials from a name.
@@ -147,16 +255,11 @@ def get_initials(name: str) -> str:
         "Marie Anna Kovarova" -> "MAK"
     """
     # Remove academic titles
-    titles = ['ing.', 'mgr.', 'bc.', 'mudr.', 'judr.', 'phdr.', 'rndr.',
-              'doc.', 'prof.', 'ph.d.', 'csc.', 'drsc.', 'mba', 'dis.']
-
-    name_lower = name.lower()
-    for title in titles:
-        name_lower = name_lower.replace(title, '')
+    cleaned = _TITLE_RE.sub('', name)
 
     # Split into words and take first letters
-    words = [w.strip() for w in name_lower.split() if w.strip()]
-    initials = ''.join(w[0].upper() for w in words if w and w[0].isalpha())
+    words = cleaned.split()
+    initials = ''.join(w[0].upper() for w in words if w[0].isalpha())
 
     return initials if initials else "?"
 
@@ -287,27 +390,35 @@ def sanitize_signer_name(name: str) -> str:
     return name
 
 
+# Czech characters -> ASCII equivalents, applied in a single pass by normalize_text
+_CZECH_TRANS = str.maketrans({
+    'á': 'a', 'č': 'c', 'ď': 'd', 'é': 'e', 'ě': 'e', 'í': 'i',
+    'ň': 'n', 'ó': 'o', 'ř': 'r', 'š': 's', 'ť': 't', 'ú': 'u',
+    'ů': 'u', 'ý': 'y', 'ž': 'z',
+    'Á': 'A', 'Č': 'C', 'Ď': 'D', 'É': 'E', 'Ě': 'E', 'Í': 'I',
+    'Ň': 'N', 'Ó': 'O', 'Ř': 'R', 'Š': 'S', 'Ť': 'T', 'Ú': 'U',
+    'Ů': 'U', 'Ý': 'Y', 'Ž': 'Z',
+})
+
+
+@functools.lru_cache(maxsize=128)
 def normalize_text(text: str) -> str:
     """
     Normalize text for PDF fonts that don't support full Unicode.
     Converts Czech characters to ASCII equivalents.
     """
-    replacements = {
-        'á': 'a', 'č': 'c', 'ď': 'd', 'é': 'e', 'ě': 'e', 'í': 'i',
-        'ň': 'n', 'ó': 'o', 'ř': 'r', 'š': 's', 'ť': 't', 'ú': 'u',
-        'ů': 'u', 'ý': 'y', 'ž': 'z',
-        'Á': 'A', 'Č': 'C', 'Ď': 'D', 'É': 'E', 'Ě': 'E', 'Í': 'I',
-        'Ň': 'N', 'Ó': 'O', 'Ř': 'R', 'Š': 'S', 'Ť': 'T', 'Ú': 'U',
-        'Ů': 'U', 'Ý': 'Y', 'Ž': 'Z',
-    }
-    for orig, repl in replacements.items():
-        text = text.replace(orig, repl)
-    return text
+    return text.translate(_CZECH_TRANS)
 
 
-def render_signature_appearance(
-    pdf_bytes: bytes,
-    page_num: int,
+def format_signature_date(now: Optional[datetime] = None) -> str:
+    """Format the signing time shown in a full signature, with timezone."""
+    if now is None:
+        now = datetime.now()
+    return now.strftime("%Y-%m-%d %H:%M:%S") + f" {_TZ_NAME}"
+
+
+def _render_on_page(
+    page: fitz.Page,
     x: float,
     y: float,
     width: float,
@@ -315,39 +426,28 @@ def render_signature_appearance(
     signer_name: str,
     signature_type: str = "full",
     font_path: Optional[Path] = None,
-) -> bytes:
+    font_pages: Optional[Set[int]] = None,
+    date_str: Optional[str] = None,
+) -> None:
     """
-    Render a custom signature appearance on the PDF using PyMuPDF.
-
-    This allows mixed fonts: name in Dancing Script, date in Helvetica.
+    Draw a signature appearance on an already open page.
 
     Args:
-        pdf_bytes: The PDF document
-        page_num: Page number (0-indexed)
-        x: X position from left edge
-        y: Y position from bottom edge
-        width: Width of signature box
-        height: Height of signature box
-        signer_name: Name of the signer
-        signature_type: "full" for signature with date, "initials" for just initials
-        font_path: Path to the fancy font file
-
-    Returns:
-        Modified PDF bytes with visual appearance added
+        page: Page to draw on
+        x, y, width, height, signer_name, signature_type, font_path:
+            See render_signature_appearance
+        font_pages: Numbers of pages that already have the fancy font
+            inserted, updated in place. Lets callers drawing several
+            signatures on one document insert the font once per page.
+        date_str: See render_signature_appearance
     """
-    if font_path is None:
-        font_path = FONT_PATH
-
-    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-    page = doc[page_num]
-
     # Convert from PDF coordinates (origin at bottom-left) to PyMuPDF (origin at top-left)
     page_height = page.rect.height
     rect_top = page_height - y - height
     rect = fitz.Rect(x, rect_top, x + width, rect_top + height)
 
     # Draw white background
-    page.draw_rect(rect, color=(0, 0, 0), fill=(1, 1, 1), width=0.5)
+    page.draw_rect(rect, color=_BLACK, fill=_WHITE, width=0.5)
 
     if signature_type == "initials":
         # Initials: just the letters, centered, larger font
@@ -364,17 +464,25 @@ def render_signature_appearance(
             initials,
             fontsize=18,
             fontname="helv",
-            color=(0, 0, 0),
+            color=_BLACK,
             render_mode=0,
         )
 
     else:  # full signature
         # Load the fancy font for the name
-        try:
-            page.insert_font(fontname="dancing", fontfile=str(font_path))
+        if font_pages is not None and page.number in font_pages:
             name_font = "dancing"
-        except Exception:
-            name_font = "helv"
+        else:
+            try:
+                if font_path is None and _FONT_BYTES is not None:
+                    page.insert_font(fontname="dancing", fontbuffer=_FONT_BYTES)
+                else:
+                    page.insert_font(fontname="dancing", fontfile=str(font_path or FONT_PATH))
+                name_font = "dancing"
+                if font_pages is not None:
+                    font_pages.add(page.number)
+            except Exception:
+                name_font = "helv"
 
         # Line 1: Name in fancy font (Dancing Script)
         name_y = rect_top + 18
@@ -383,20 +491,12 @@ def render_signature_appearance(
             signer_name,
             fontsize=14,
             fontname=name_font,
-            color=(0, 0, 0),
+            color=_BLACK,
         )
 
         # Line 2: Date/time in normal font (Helvetica)
-        now = datetime.now()
-        date_str = now.strftime("%Y-%m-%d %H:%M:%S %Z").strip()
-        if not date_str.endswith(('CET', 'CEST', 'UTC', 'GMT')):
-            # Add timezone indicator
-            import time
-            if time.daylight:
-                tz = time.tzname[1]
-            else:
-                tz = time.tzname[0]
-            date_str = now.strftime("%Y-%m-%d %H:%M:%S") + f" {tz}"
+        if date_str is None:
+            date_str = format_signature_date()
 
         date_y = rect_top + 32
         page.insert_text(
@@ -404,7 +504,7 @@ def render_signature_appearance(
             date_str,
             fontsize=8,
             fontname="helv",
-            color=(0.3, 0.3, 0.3),
+            color=_DATE_GRAY,
         )
 
         # Line 3: GitHub URL in small font
@@ -414,9 +514,57 @@ def render_signature_appearance(
             "github.com/keboola/esignature",
             fontsize=6,
             fontname="helv",
-            color=(0.5, 0.5, 0.5),
+            color=_URL_GRAY,
         )
 
+
+def render_signature_appearance(
+    pdf_bytes: bytes,
+    page_num: int,
+    x: float,
+    y: float,
+    width: float,
+    height: float,
+    signer_name: str,
+    signature_type: str = "full",
+    font_path: Optional[Path] = None,
+    date_str: Optional[str] = None,
+) -> bytes:
+    """
+    Render a custom signature appearance on the PDF using PyMuPDF.
+
+    This allows mixed fonts: name in Dancing Script, date in Helvetica.
+
+    Args:
+        pdf_bytes: The PDF document
+        page_num: Page number (0-indexed)
+        x: X position from left edge
+        y: Y position from bottom edge
+        width: Width of signature box
+        height: Height of signature box
+        signer_name: Name of the signer
+        signature_type: "full" for signature with date, "initials" for just initials
+        font_path: Path to the fancy font file
+        date_str: Signing time shown in a full signature
+            (default: current time, see format_signature_date)
+
+    Returns:
+        Modified PDF bytes with visual appearance added
+    """
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+
+    _render_on_page(
+        doc[page_num],
+        x=x,
+        y=y,
+        width=width,
+        height=height,
+        signer_name=signer_name,
+        signature_type=signature_type,
+        font_path=font_path,
+        date_str=date_str,
+    )
+
     # Save and return
     output = io.BytesIO()
     doc.save(output)
@@ -441,18 +589,14 @@ def create_minimal_stamp_style() -> TextStampStyle:
     return stamp_style
 
 
-def create_protocol_page(
-    pdf_bytes: bytes,
+def _add_protocol_page(
+    doc: fitz.Document,
     signatures_info: List[Dict],
     signer_name: str,
     cert_info: Dict,
     github_url: str = "https://github.com/keboola/esignature",
-) -> bytes:
-    """
-    Create a protocol page with signature and certificate information.
-    """
-    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-
+) -> None:
+    """Append the protocol page to an already open document."""
     # Create new A4 page
     page = doc.new_page(width=595, height=842)
 
@@ -513,23 +657,23 @@ def create_protocol_page(
     )
     y_pos += 18
 
+    # Normalize cert fields once, then build the lines from a
+    # (label, key, optional) table - optional lines are skipped when empty
+    norm = {k: normalize_text(v) for k, v in cert_info.items() if isinstance(v, str)}
+    cert_fields = [
+        ("Owner", "subject_cn", False),
+        ("Organization", "subject_org", True),
+        ("Issuer", "issuer_cn", False),
+        ("Issuer Org", "issuer_org", True),
+        ("Valid from", "valid_from", False),
+        ("Valid until", "valid_to", False),
+        ("Serial number", "serial_number", False),
+    ]
     cert_lines = [
-        f"Owner: {normalize_text(cert_info.get('subject_cn', ''))}",
+        f"{label}: {norm.get(key, '')}"
+        for label, key, optional in cert_fields
+        if not optional or norm.get(key)
     ]
-    if cert_info.get('subject_org'):
-        cert_lines.append(f"Organization: {normalize_text(cert_info.get('subject_org', ''))}")
-
-    cert_lines.extend([
-        f"Issuer: {normalize_text(cert_info.get('issuer_cn', ''))}",
-    ])
-    if cert_info.get('issuer_org'):
-        cert_lines.append(f"Issuer Org: {normalize_text(cert_info.get('issuer_org', ''))}")
-
-    cert_lines.extend([
-        f"Valid from: {cert_info.get('valid_from', '')}",
-        f"Valid until: {cert_info.get('valid_to', '')}",
-        f"Serial number: {cert_info.get('serial_number', '')}",
-    ])
 
     for line in cert_lines:
         page.insert_text((margin + 10, y_pos), line, fontsize=text_font_size, fontname="helv")
@@ -598,9 +742,24 @@ def create_protocol_page(
         footer_text,
         fontsize=small_font_size,
         fontname="helv",
-        color=(0.4, 0.4, 0.4),
+        color=_FOOTER_GRAY,
     )
 
+
+def create_protocol_page(
+    pdf_bytes: bytes,
+    signatures_info: List[Dict],
+    signer_name: str,
+    cert_info: Dict,
+    github_url: str = "https://github.com/keboola/esignature",
+) -> bytes:
+    """
+    Create a protocol page with signature and certificate information.
+    """
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+
+    _add_protocol_page(doc, signatures_info, signer_name, cert_info, github_url)
+
     # Save to bytes
     output = io.BytesIO()
     doc.save(output)
@@ -609,6 +768,161 @@ def create_protocol_page(
     return output.getvalue()
 
 
+def _prepare_pdf_visuals(
+    pdf_bytes: bytes,
+    placements: List[Dict],
+    signer_name: str,
+    cert_info: Dict,
+    add_protocol_page: bool,
+) -> io.BytesIO:
+    """
+    Add the protocol page and all signature appearances in one PyMuPDF pass.
+
+    The document is opened and saved exactly once, instead of a full
+    parse/save cycle for the protocol page and for every signature.
+
+    Args:
+        pdf_bytes: The PDF document
+        placements: Signatures with resolved "page", "x", "y", "width",
+            "height" and "type"
+        signer_name: Name of the signer
+        cert_info: Certificate details for the protocol page
+        add_protocol_page: Whether to add a protocol page
+
+    Returns:
+        Stream with the saved document, ready for incremental signing
+    """
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+
+    if add_protocol_page:
+        _add_protocol_page(doc, placements, signer_name, cert_info)
+
+    font_pages = set()
+    # All signatures of one job show the same signing time
+    date_str = format_signature_date()
+    for sig in placements:
+        _render_on_page(
+            doc[sig["page"]],
+            x=sig["x"],
+            y=sig["y"],
+            width=sig["width"],
+            height=sig["height"],
+            signer_name=signer_name,
+            signature_type=sig["type"],
+            font_pages=font_pages,
+            date_str=date_str,
+        )
+
+    output = io.BytesIO()
+    doc.save(output)
+    doc.close()
+
+    return output
+
+
+def _sign_to_stream(
+    pdf_bytes: bytes,
+    p12_bytes: bytes,
+    p12_password: str,
+    signatures: List[Dict],
+    add_protocol_page: bool,
+    reason: str,
+) -> io.BytesIO:
+    """
+    Render and sign the PDF, see sign_pdf_multiple for the arguments.
+
+    Returns:
+        Stream with the signed (not locked) PDF
+    """
+    # Load the signer. Signing runs in worker processes, which wouldn't share
+    # the UI process cache, so don't keep signers alive there.
+    signer = load_signer_from_p12(p12_bytes, p12_password)
+
+    # Validate certificate before using it
+    validate_certificate(signer)
+
+    # Get and sanitize signer name
+    raw_signer_name, cert_info = get_signer_name_and_info(signer)
+    signer_name = sanitize_signer_name(raw_signer_name)
+
+    # Resolve the box size of every signature
+    placements = []
+    for sig in signatures:
+        sig_type = sig.get("type", "full")
+
+        # Size based on signature type
+        default_width, default_height = _DEFAULT_SIG_SIZE.get(sig_type, _DEFAULT_SIG_SIZE["full"])
+        width = sig.get("width", default_width)
+        height = sig.get("height", default_height)
+
+        placements.append({
+            "page": sig["page"],
+            "x": sig["x"],
+            "y": sig["y"],
+            "width": width,
+            "height": height,
+            "type": sig_type,
+        })
+
+    # Step 1: Add the protocol page (if requested) and render all visual
+    # appearances using PyMuPDF. The saved document is the stream every
+    # signature is appended to.
+    pdf_stream = _prepare_pdf_visuals(
+        pdf_bytes,
+        placements,
+        signer_name,
+        cert_info,
+        add_protocol_page,
+    )
+
+    # Step 2: Create all signature fields at their visual locations in a
+    # single incremental update, so the signing passes only do the crypto
+    field_names = [f"Signature_{i + 1}" for i in range(len(placements))]
+
+    pdf_stream.seek(0)
+    field_writer = IncrementalPdfFileWriter(pdf_stream, strict=False)
+    for field_name, sig in zip(field_names, placements):
+        x = sig["x"]
+        y = sig["y"]
+        fields.append_signature_field(
+            field_writer,
+            fields.SigFieldSpec(
+                sig_field_name=field_name,
+                box=(x, y, x + sig["width"], y + sig["height"]),
+                on_page=sig["page"],
+            ),
+        )
+    field_writer.write_in_place()
+
+    # Create minimal stamp style (visual appearance is rendered separately)
+    stamp_style = create_minimal_stamp_style()
+
+    # Step 3: Apply each cryptographic signature incrementally using pyhanko
+    for field_name in field_names:
+        # Signature metadata
+        signature_meta = PdfSignatureMetadata(
+            field_name=field_name,
+            reason=reason,
+            location='',
+        )
+
+        # Prepare PDF writer
+        pdf_stream.seek(0)
+        pdf_writer = IncrementalPdfFileWriter(pdf_stream, strict=False)
+
+        # Sign the field created above
+        pdf_signer = signers.PdfSigner(
+            signature_meta=signature_meta,
+            signer=signer,
+            stamp_style=stamp_style,
+        )
+
+        # Append the incremental update to the same stream
+        pdf_signer.sign_pdf(pdf_writer, existing_fields_only=True, in_place=True)
+
+    return pdf_stream
+
+
 def sign_pdf_multiple(
     pdf_bytes: bytes,
     p12_bytes: bytes,
@@ -643,116 +957,87 @@ def sign_pdf_multiple(
         raise ValueError("At least one signature position is required")
 
     try:
-        # Load the signer
-        signer = load_signer_from_p12(p12_bytes, p12_password)
-
-        # Validate certificate before using it
-        validate_certificate(signer)
-
-        # Get and sanitize signer name
-        raw_signer_name = get_signer_name_from_signer(signer)
-        signer_name = sanitize_signer_name(raw_signer_name)
-
-        cert_info = get_certificate_info(signer)
-
-        # Add protocol page if requested
-        current_pdf = pdf_bytes
-        if add_protocol_page:
-            current_pdf = create_protocol_page(
-                current_pdf,
-                signatures,
-                signer_name,
-                cert_info,
-            )
+        pdf_stream = _sign_to_stream(
+            pdf_bytes, p12_bytes, p12_password, signatures, add_protocol_page, reason,
+        )
+        current_pdf = pdf_stream.getvalue()
 
-        # Create minimal stamp style (visual appearance is rendered separately)
-        stamp_style = create_minimal_stamp_style()
-
-        # Add each signature incrementally
-        for i, sig in enumerate(signatures):
-            page_number = sig["page"]
-            x = sig["x"]
-            y = sig["y"]
-            sig_type = sig.get("type", "full")
-
-            # Size based on signature type
-            if sig_type == "initials":
-                width = sig.get("width", INITIALS_WIDTH)
-                height = sig.get("height", INITIALS_HEIGHT)
-            else:
-                width = sig.get("width", SIGNATURE_WIDTH)
-                height = sig.get("height", SIGNATURE_HEIGHT)
-
-            # Step 1: Render the visual appearance using PyMuPDF
-            current_pdf = render_signature_appearance(
-                pdf_bytes=current_pdf,
-                page_num=page_number,
-                x=x,
-                y=y,
-                width=width,
-                height=height,
-                signer_name=signer_name,
-                signature_type=sig_type,
-            )
+        # Lock PDF if requested
+        if lock_after_signing:
+            current_pdf = lock_pdf_for_editing(current_pdf)
 
-            # Step 2: Apply cryptographic signature using pyhanko
-            field_name = f"Signature_{i + 1}"
+        return current_pdf
 
-            # Create field specification at the same location
-            sig_field = fields.SigFieldSpec(
-                sig_field_name=field_name,
-                box=(x, y, x + width, y + height),
-                on_page=page_number,
-            )
+    except CertificateValidationError:
+        # Re-raise certificate validation errors as-is
+        raise
+    except Exception as e:
+        raise ValueError(f"Failed to sign PDF: {str(e)}") from e
 
-            # Signature metadata
-            signature_meta = PdfSignatureMetadata(
-                field_name=field_name,
-                reason=reason,
-                location='',
-            )
 
-            # Prepare PDF writer
-            pdf_stream = io.BytesIO(current_pdf)
-            pdf_writer = IncrementalPdfFileWriter(pdf_stream, strict=False)
+def sign_pdf_multiple_into(
+    pdf_bytes: bytes,
+    p12_bytes: bytes,
+    p12_password: str,
+    signatures: List[Dict],
+    output: BinaryIO,
+    lock_after_signing: bool = False,
+    add_protocol_page: bool = False,
+    reason: str = "Electronically signed",
+) -> None:
+    """
+    Sign a PDF document like sign_pdf_multiple, writing it to a stream.
 
-            # Sign
-            pdf_signer = signers.PdfSigner(
-                signature_meta=signature_meta,
-                signer=signer,
-                stamp_style=stamp_style,
-                new_field_spec=sig_field,
-            )
+    Useful for streaming responses: the signed PDF is written from the
+    signing buffer into output with a single write, without materializing
+    it as bytes first. Output only needs write(), it doesn't have to be
+    seekable.
 
-            out = io.BytesIO()
-            pdf_signer.sign_pdf(pdf_writer, output=out)
-            current_pdf = out.getvalue()
+    Args:
+        output: Writable binary stream the signed PDF is written to
+        Other arguments: See sign_pdf_multiple
+    """
+    if not signatures:
+        raise ValueError("At least one signature position is required")
+
+    pdf_stream = None
+    try:
+        pdf_stream = _sign_to_stream(
+            pdf_bytes, p12_bytes, p12_password, signatures, add_protocol_page, reason,
+        )
 
-        # Lock PDF if requested
         if lock_after_signing:
-            current_pdf = lock_pdf_for_editing(current_pdf)
+            # PyMuPDF seeks while saving, so lock into a local buffer first
+            locked = io.BytesIO()
+            _save_locked(pdf_stream.getvalue(), locked)
+            pdf_stream.close()
+            pdf_stream = locked
 
-        return current_pdf
+        with pdf_stream.getbuffer() as view:
+            output.write(view)
 
     except CertificateValidationError:
         # Re-raise certificate validation errors as-is
         raise
     except Exception as e:
         raise ValueError(f"Failed to sign PDF: {str(e)}") from e
+    finally:
+        if pdf_stream is not None:
+            pdf_stream.close()
 
 
-def lock_pdf_for_editing(pdf_bytes: bytes) -> bytes:
+def _save_locked(pdf_bytes: bytes, output: BinaryIO) -> None:
     """
-    Lock PDF to prevent editing (but allow viewing and printing).
+    Save the PDF into output, locked as described in lock_pdf_for_editing.
+
+    Output must be seekable, PyMuPDF calls tell()/seek() while saving.
     """
     doc = fitz.open(stream=pdf_bytes, filetype="pdf")
 
     perm = fitz.PDF_PERM_PRINT | fitz.PDF_PERM_COPY | fitz.PDF_PERM_ACCESSIBILITY
 
-    import secrets
     owner_pass = secrets.token_hex(16)
 
-    output = io.BytesIO()
     doc.save(
         output,
         encryption=fitz.PDF_ENCRYPT_AES_256,
@@ -762,6 +1047,13 @@ def lock_pdf_for_editing(pdf_bytes: bytes) -> bytes:
     )
     doc.close()
 
+
+def lock_pdf_for_editing(pdf_bytes: bytes) -> bytes:
+    """
+    Lock PDF to prevent editing (but allow viewing and printing).
+    """
+    output = io.BytesIO()
+    _save_locked(pdf_bytes, output)
     return output.getvalue()
 
 